@@ -43,13 +43,12 @@ def create_agent_for_strategy(strategy_id: int):
     # Get tools based on strategy
     tools = _get_tools_for_strategy(strategy_id)
 
-    # Format the prompt with iteration limits
-    prompt = _format_strategy_prompt(strategy_id, strategy.orchestrator_prompt)
-
     return create_deep_agent(
         model=get_llm(),
         tools=tools,
-        system_prompt=prompt,
+        # Iteration limits are already baked into the prompt at import time
+        # by src.prompts.core_agent_prompts; no per-request formatting needed.
+        system_prompt=strategy.orchestrator_prompt,
         subagents=subagents,  # type: ignore
     )
 
@@ -75,27 +74,6 @@ def _get_tools_for_strategy(strategy_id: int) -> list:
     return strategy_tools.get(strategy_id, ToolSets.THINKING_WITH_SAVE)
 
 
-def _format_strategy_prompt(strategy_id: int, prompt: str) -> str:
-    """Format a strategy prompt with iteration limits."""
-    format_params = {
-        1: {"max_diver_iterations": 3},
-        2: {"max_workflow_iterations": 3},
-        3: {},  # No params
-        4: {"max_swarm_iterations": 2},
-        5: {"max_refinement_iterations": 3},
-        6: {"max_domain_iterations": 2},
-        7: {"max_debate_iterations": 2},
-        8: {"max_hierarchical_iterations": 2},
-        9: {"max_realtime_iterations": 1},
-        10: {"max_comparison_iterations": 2},
-    }
-
-    params = format_params.get(strategy_id, {})
-    if params:
-        return prompt.format(**params)
-    return prompt
-
-
 # =============================================================================
 # Legacy Factory Functions (Backward Compatibility)
 # These explicit factory functions are kept for backward compatibility
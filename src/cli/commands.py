@@ -4,9 +4,12 @@ Enhanced CLI Commands for NAMI Research System
 Provides new slash commands with improved help and functionality.
 """
 
+import atexit
+import difflib
 import os
 import sys
 import json
+from collections import deque
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass
@@ -40,6 +43,9 @@ class CommandRegistry:
     def __init__(self):
         self._commands: Dict[str, Callable] = {}
         self._info: Dict[str, CommandInfo] = {}
+        # Names (including aliases) bucketed by length, so find_similar can
+        # skip candidates that are too short to contain the query
+        self._names_by_len: Dict[int, List[str]] = {}
         self._categories = {
             "research": "Research Commands",
             "config": "Configuration",
@@ -51,12 +57,18 @@ class CommandRegistry:
         """Decorator to register a command"""
 
         def decorator(func: Callable):
-            self._commands[info.name] = func
-            self._info[info.name] = info
+            # Normalize once at registration so lookups and similarity
+            # matching never re-lowercase stored names
+            name = info.name.lower()
+            self._commands[name] = func
+            self._info[name] = info
+            self._names_by_len.setdefault(len(name), []).append(name)
 
             # Register aliases
             for alias in info.aliases or []:
+                alias = alias.lower()
                 self._commands[alias] = func
+                self._names_by_len.setdefault(len(alias), []).append(alias)
                 # Store info for alias too (for help lookup)
                 alias_info = CommandInfo(
                     name=alias,
@@ -104,19 +116,33 @@ class CommandRegistry:
     def find_similar(self, query: str, max_results: int = 3) -> List[str]:
         """Find commands similar to query"""
         query = query.lower()
-        matches = []
+        qlen = len(query)
+
+        # A prefix/substring match requires the name to be at least as long
+        # as the query, so skip the shorter length buckets entirely
+        candidates = [
+            name
+            for length, names in self._names_by_len.items()
+            if length >= qlen
+            for name in names
+        ]
 
         # Exact prefix matches first
-        for name in self._commands:
-            if name.startswith(query):
-                matches.append(name)
+        matches = [name for name in candidates if name.startswith(query)]
 
         # Substring matches
         if len(matches) < max_results:
-            for name in self._commands:
+            for name in candidates:
                 if query in name and name not in matches:
                     matches.append(name)
 
+        # Fuzzy fallback for typos (e.g. "hlep") - candidates here may be
+        # shorter than the query, so match against all registered names
+        if not matches:
+            matches = difflib.get_close_matches(
+                query, self._commands.keys(), n=max_results, cutoff=0.6
+            )
+
         return matches[:max_results]
 
 
@@ -204,7 +230,9 @@ class CommandHistory:
     MAX_COMMANDS = 500
 
     def __init__(self):
-        self._commands: List[str] = []
+        # Bounded ring buffer - adds stay in-memory; disk writes happen only
+        # on explicit flush()/save() (at /exit and interpreter shutdown)
+        self._commands: deque = deque(maxlen=self.MAX_COMMANDS)
         self._load()
 
     def _load(self) -> None:
@@ -212,26 +240,28 @@ class CommandHistory:
         try:
             if self.HISTORY_FILE.exists():
                 with open(self.HISTORY_FILE, "r", encoding="utf-8") as f:
-                    self._commands = [line.strip() for line in f.readlines()]
+                    self._commands.extend(line.strip() for line in f)
         except PermissionError:
             # Silently ignore permission errors on load (common on first run)
-            self._commands = []
+            pass
         except Exception as e:
             console.warning(f"Failed to load command history: {e}")
-            self._commands = []
 
     def save(self) -> None:
         """Save command history"""
         try:
             self.HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
             with open(self.HISTORY_FILE, "w", encoding="utf-8") as f:
-                for cmd in self._commands[-self.MAX_COMMANDS :]:
+                for cmd in self._commands:
                     f.write(cmd + "\n")
         except PermissionError:
             console.warning("Cannot save command history: permission denied")
         except Exception as e:
             console.warning(f"Failed to save command history: {e}")
 
+    # Alias used by callers that want to make persistence explicit
+    flush = save
+
     def add(self, command: str) -> None:
         """Add a command to history"""
         if command and (not self._commands or self._commands[-1] != command):
@@ -239,16 +269,19 @@ class CommandHistory:
 
     def get_all(self) -> List[str]:
         """Get all commands"""
-        return self._commands
+        return list(self._commands)
 
     def get_recent(self, count: int = 20) -> List[str]:
         """Get recent commands"""
-        return list(reversed(self._commands[-count:]))
+        return list(reversed(list(self._commands)[-count:]))
 
 
 # Global command history
 command_history = CommandHistory()
 
+# Safety net: persist history even if the REPL exits without /exit
+atexit.register(command_history.save)
+
 
 def format_help_for_command(info: CommandInfo) -> str:
     """Format detailed help for a command"""
@@ -901,7 +934,10 @@ def cmd_clear(args: str, session) -> None:
     """Clear screen"""
     from src.ui.cli_branding import print_banner
 
-    os.system("cls" if os.name == "nt" else "clear")
+    # ANSI clear + cursor home - avoids forking a shell just to clear the
+    # screen (Windows 10+ terminals understand this sequence too)
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
     print_banner(style="simple")
     console.print()
 
@@ -917,14 +953,21 @@ def cmd_clear(args: str, session) -> None:
 )
 def cmd_version(args: str, session) -> None:
     """Show version information"""
-    console.print(f"\n{Colors.BRIGHT_WHITE}NAMI Version Information{Colors.RESET}\n")
-    console.print(f"  Version:    {Colors.BRIGHT_CYAN}1.1.0{Colors.RESET}")
-    console.print(f"  Author:     {Colors.BRIGHT_CYAN}NAMI Team{Colors.RESET}")
-    console.print(f"  Strategies: {Colors.BRIGHT_CYAN}10{Colors.RESET}")
-    console.print(
-        f"  Python:     {Colors.BRIGHT_CYAN}{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}{Colors.RESET}"
-    )
-    console.print()
+    console.print(_VERSION_BANNER)
+
+
+# Every field in the version banner is constant for the lifetime of the
+# process, so build it once
+_VERSION_BANNER = "\n".join(
+    [
+        f"\n{Colors.BRIGHT_WHITE}NAMI Version Information{Colors.RESET}\n",
+        f"  Version:    {Colors.BRIGHT_CYAN}1.1.0{Colors.RESET}",
+        f"  Author:     {Colors.BRIGHT_CYAN}NAMI Team{Colors.RESET}",
+        f"  Strategies: {Colors.BRIGHT_CYAN}10{Colors.RESET}",
+        f"  Python:     {Colors.BRIGHT_CYAN}{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}{Colors.RESET}",
+        "",
+    ]
+)
 
 
 @registry.register(
@@ -939,6 +982,7 @@ def cmd_version(args: str, session) -> None:
 )
 def cmd_exit(args: str, session) -> None:
     """Exit NAMI"""
+    command_history.flush()
     session.running = False
     console.print(f"\n{Colors.BRIGHT_GREEN}Thanks for using NAMI!{Colors.RESET}\n")
 
@@ -954,18 +998,24 @@ def execute_command(command_line: str, session) -> Optional[str]:
     if not command_line.startswith("/"):
         return None
 
-    # Parse command
-    parts = command_line[1:].strip().split(None, 1)
+    # Parse command - scan for the first space instead of strip().split(),
+    # since the common case is a bare "/name" with no args
+    rest = command_line[1:].strip()
 
-    if not parts:
+    if not rest:
         console.print(format_command_list())
         return None
 
-    cmd_name = parts[0].lower()
+    space = rest.find(" ")
+    if space == -1:
+        cmd_name = rest.lower()
+        args = ""
+    else:
+        cmd_name = rest[:space].lower()
+        args = rest[space + 1 :].lstrip()
 
     # Check for --help flag
-    args = parts[1] if len(parts) > 1 else ""
-    if args == "--help" or args == "-h":
+    if args in ("--help", "-h"):
         info = registry.get_info(cmd_name)
         if info:
             console.print(format_help_for_command(info))
@@ -973,8 +1023,9 @@ def execute_command(command_line: str, session) -> Optional[str]:
             console.error(f"Unknown command: {cmd_name}")
         return None
 
-    # Execute command
-    handler = registry.get_command(cmd_name)
+    # Execute command (cmd_name is already lowercased, so hit the dispatch
+    # dict directly instead of re-normalizing in get_command)
+    handler = registry._commands.get(cmd_name)
     if handler:
         try:
             result = handler(args, session)
@@ -18,11 +18,17 @@ Usage:
 from langchain_ollama import ChatOllama
 from dotenv import load_dotenv
 import os
-from datetime import datetime
+from datetime import date
 from typing import Optional
 
-# Load environment variables
-load_dotenv()
+# Load environment variables exactly once per process.
+# Repeated imports of this module (test runners, reload paths) should not
+# re-read and re-parse the .env file.
+_DOTENV_LOADED = False
+
+if not _DOTENV_LOADED:
+    load_dotenv()
+    _DOTENV_LOADED = True
 
 
 class Config:
@@ -88,7 +94,21 @@ class Config:
     # =============================================================================
     # System Information
     # =============================================================================
-    CURRENT_DATE = datetime.now().strftime("%Y-%m-%d")
+
+    # Cached (date, formatted string) for current_date(); recomputed when
+    # the day rolls over so long-running sessions stay correct
+    _current_date_cache: Optional[tuple] = None
+
+    # Cached result of get_config_dict(); invalidated whenever config mutates
+    _config_dict_cache: Optional[dict] = None
+
+    @classmethod
+    def current_date(cls) -> str:
+        """Return today's date as YYYY-MM-DD, memoized per day."""
+        today = date.today()
+        if cls._current_date_cache is None or cls._current_date_cache[0] != today:
+            cls._current_date_cache = (today, today.strftime("%Y-%m-%d"))
+        return cls._current_date_cache[1]
 
     @classmethod
     def reload_from_env(cls):
@@ -99,22 +119,26 @@ class Config:
         cls.MAX_TOKENS = int(os.getenv("MAX_TOKENS", "4096"))
         cls.RESEARCH_STRATEGY = int(os.getenv("RESEARCH_STRATEGY", "4"))
         # ... reload other configs as needed
+        cls._config_dict_cache = None
 
     @classmethod
     def get_config_dict(cls) -> dict:
         """Get all configuration as a dictionary."""
-        return {
-            "model_name": cls.MODEL_NAME,
-            "temperature": cls.TEMPERATURE,
-            "max_tokens": cls.MAX_TOKENS,
-            "research_strategy": cls.RESEARCH_STRATEGY,
-            "max_concurrent_units": cls.MAX_CONCURRENT_RESEARCH_UNITS,
-            "max_iterations": cls.MAX_RESEARCHER_ITERATIONS,
-            "persona_mode": cls.PERSONA_MODE,
-            "cli_style": cls.CLI_STYLE,
-            "verbose": cls.VERBOSE,
-            "debug": cls.DEBUG,
-        }
+        if cls._config_dict_cache is None:
+            cls._config_dict_cache = {
+                "model_name": cls.MODEL_NAME,
+                "temperature": cls.TEMPERATURE,
+                "max_tokens": cls.MAX_TOKENS,
+                "research_strategy": cls.RESEARCH_STRATEGY,
+                "max_concurrent_units": cls.MAX_CONCURRENT_RESEARCH_UNITS,
+                "max_iterations": cls.MAX_RESEARCHER_ITERATIONS,
+                "persona_mode": cls.PERSONA_MODE,
+                "cli_style": cls.CLI_STYLE,
+                "verbose": cls.VERBOSE,
+                "debug": cls.DEBUG,
+            }
+        # Copy so callers can't mutate the cached dict
+        return cls._config_dict_cache.copy()
 
 
 # =============================================================================
@@ -157,8 +181,17 @@ def get_llm(
     target_model = model or os.getenv("MODEL_NAME") or Config.MODEL_NAME
     target_temp = temperature if temperature is not None else Config.TEMPERATURE
 
-    # Check if we need to create or recreate the instance
-    if _llm_instance is None or model is not None:
+    # Check if we need to create or recreate the instance. Re-requesting
+    # the current model/temperature reuses the existing instance instead
+    # of paying ChatOllama construction again.
+    if (
+        _llm_instance is None
+        or (model is not None and getattr(_llm_instance, "model", None) != target_model)
+        or (
+            temperature is not None
+            and getattr(_llm_instance, "temperature", None) != target_temp
+        )
+    ):
         _llm_instance = ChatOllama(
             model=target_model,
             temperature=target_temp,
@@ -188,6 +221,7 @@ def update_llm_model(model_name: str) -> ChatOllama:
     # Update environment variable for the session
     os.environ["MODEL_NAME"] = model_name
     Config.MODEL_NAME = model_name
+    Config._config_dict_cache = None
 
     # Create new LLM instance with updated model
     _llm_instance = ChatOllama(
@@ -216,8 +250,13 @@ def reset_llm():
 # Create default LLM instance for backward compatibility
 llm = get_llm()
 
-# Export current_date for backward compatibility
-current_date = Config.CURRENT_DATE
+# Export current_date for backward compatibility. Resolved lazily via
+# PEP 562 so it reflects the actual current day instead of freezing to
+# the moment this module was first imported.
+def __getattr__(name):
+    if name in ("current_date", "CURRENT_DATE"):
+        return Config.current_date()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -1,12 +1,31 @@
-"""
-MCP (Model Context Protocol) integration for the multi-agent system.
-"""
-
-from mcps.client import (
-    get_mcp_client,
-    get_mcp_client_with_memory,
-    get_default_mcp_client,
-)
-from mcps.mcp_tools import get_mcp_tools, get_mcp_tools_by_server
-
-__all__ = ["get_mcp_client", "get_mcp_tools", "get_mcp_tools_by_server"]
+"""
+MCP (Model Context Protocol) integration for the multi-agent system.
+
+Submodules are imported lazily (PEP 562) so that CLI commands which never
+touch MCP don't pay for `langchain_mcp_adapters` at import time.
+"""
+
+__all__ = ["get_mcp_client", "get_mcp_tools", "get_mcp_tools_by_server"]
+
+_CLIENT_EXPORTS = {
+    "get_mcp_client",
+    "get_mcp_client_with_memory",
+    "get_default_mcp_client",
+}
+_TOOLS_EXPORTS = {"get_mcp_tools", "get_mcp_tools_by_server"}
+
+
+def __getattr__(name):
+    if name in _CLIENT_EXPORTS:
+        from mcps import client
+
+        value = getattr(client, name)
+    elif name in _TOOLS_EXPORTS:
+        from mcps import mcp_tools
+
+        value = getattr(mcp_tools, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
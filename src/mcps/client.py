@@ -1,10 +1,42 @@
-from langchain_mcp_adapters.client import MultiServerMCPClient
 import os
 import logging
 from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
+# Server specs are constants - built once at module load instead of being
+# reconstructed on every get_mcp_client() call. Treat them as read-only.
+_BASE_SERVERS: Dict[str, Any] = {
+    "sequentialthinking": {
+        "transport": "stdio",
+        "command": "npx",
+        "args": ["-y", "@modelcontextprotocol/server-sequential-thinking"],
+    },
+    "arxiv-latex-mcp": {
+        "transport": "stdio",
+        "command": "uv",
+        "args": [
+            "--directory",
+            "B:/Winter 2025 Projects/Proj-2 - Multi-Agent/mcps/arxiv-latex-mcp",
+            "run",
+            "server/main.py",
+        ],
+    },
+}
+
+_MEMORY_SERVER: Dict[str, Any] = {
+    "transport": "stdio",
+    "command": "npx",
+    "args": ["-y", "@modelcontextprotocol/server-memory"],
+    "env": {"MEMORY_FILE_PATH": os.path.join(os.getcwd(), "memory.jsonl")},
+}
+
+_MARKDOWN_PDF_SERVER: Dict[str, Any] = {
+    "transport": "stdio",
+    "command": "npx",
+    "args": ["md-mermaid-to-pdf-mcp"],
+}
+
 
 def get_mcp_client(
     include_memory: bool = False, include_markdown_pdf: bool = False
@@ -18,40 +50,19 @@ def get_mcp_client(
     Returns:
         MultiServerMCPClient with selected servers enabled
     """
-    servers: Dict[str, Any] = {
-        "sequentialthinking": {
-            "transport": "stdio",
-            "command": "npx",
-            "args": ["-y", "@modelcontextprotocol/server-sequential-thinking"],
-        },
-        "arxiv-latex-mcp": {
-            "transport": "stdio",
-            "command": "uv",
-            "args": [
-                "--directory",
-                "B:/Winter 2025 Projects/Proj-2 - Multi-Agent/mcps/arxiv-latex-mcp",
-                "run",
-                "server/main.py",
-            ],
-        },
-    }
+    # Imported here so that merely importing this module stays cheap;
+    # langchain_mcp_adapters is only needed once a client is actually built.
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
+    servers: Dict[str, Any] = dict(_BASE_SERVERS)
 
     # Add optional servers only when specifically requested
     if include_memory:
-        servers["memory"] = {
-            "transport": "stdio",
-            "command": "npx",
-            "args": ["-y", "@modelcontextprotocol/server-memory"],
-            "env": {"MEMORY_FILE_PATH": os.path.join(os.getcwd(), "memory.jsonl")},
-        }
+        servers["memory"] = _MEMORY_SERVER
         logger.info("Memory MCP server enabled")
 
     if include_markdown_pdf:
-        servers["markdown-pdf"] = {
-            "transport": "stdio",
-            "command": "npx",
-            "args": ["md-mermaid-to-pdf-mcp"],
-        }
+        servers["markdown-pdf"] = _MARKDOWN_PDF_SERVER
         logger.info("Markdown PDF MCP server enabled")
 
     return MultiServerMCPClient(servers)  # type: ignore
@@ -2,94 +2,183 @@
 Utility functions for working with MCP tools in LangChain agents.
 """
 
-from mcps.client import get_mcp_client, get_default_mcp_client, get_mcp_client_with_memory
-from typing import List
+from mcps.client import get_default_mcp_client, get_mcp_client_with_memory
+from typing import Dict, List, Tuple
 import logging
 import asyncio
 import os
 import sys
+import threading
+import time
 import concurrent.futures
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of sync-compatible tool lists, keyed on the loading
+# options. Each entry is (timestamp, tools). Fresh entries are returned
+# directly; stale entries are served immediately while a daemon thread
+# refreshes them in the background (stale-while-revalidate). This avoids
+# re-launching the stdio server subprocesses (npx/uv) on every call.
+_TOOLS_CACHE: Dict[Tuple, Tuple[float, List]] = {}
+_TOOLS_TTL = 300  # seconds
+_REFRESHING: set = set()
+_CACHE_LOCK = threading.Lock()
+
+# Shared background event loop for running async tool calls from sync code.
+# Created lazily on first use and reused for every subsequent call, instead
+# of spinning up a fresh thread + event loop per tool invocation.
+_bg_loop = None
+_BG_LOOP_LOCK = threading.Lock()
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting its thread on first use."""
+    global _bg_loop
+    if _bg_loop is None:
+        with _BG_LOOP_LOCK:
+            if _bg_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, daemon=True, name="mcp-tool-loop"
+                ).start()
+                _bg_loop = loop
+    return _bg_loop
+
+
+def _cached_tools(key: Tuple, loader, silent: bool) -> List:
+    """Return cached tools for `key`, loading or refreshing as needed.
+
+    `loader` is a callable taking a `silent` flag, performing the blocking
+    load and returning a (possibly empty) tool list. Background refreshes
+    always run silently. Failed loads (empty lists) are not cached so the
+    next call retries.
+    """
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        entry = _TOOLS_CACHE.get(key)
+        refreshing = key in _REFRESHING
+        if entry is not None and not refreshing and now - entry[0] >= _TOOLS_TTL:
+            _REFRESHING.add(key)
+            needs_refresh = True
+        else:
+            needs_refresh = False
+
+    if entry is not None:
+        if needs_refresh:
+
+            def refresh():
+                try:
+                    tools = loader(True)
+                    if tools:
+                        with _CACHE_LOCK:
+                            _TOOLS_CACHE[key] = (time.monotonic(), tools)
+                except Exception as e:
+                    logger.warning(f"Background MCP tool refresh failed: {e}")
+                finally:
+                    with _CACHE_LOCK:
+                        _REFRESHING.discard(key)
+
+            threading.Thread(target=refresh, daemon=True).start()
+        return entry[1]
+
+    tools = loader(silent)
+    if tools:
+        with _CACHE_LOCK:
+            _TOOLS_CACHE[key] = (time.monotonic(), tools)
+    return tools
+
+
+# Shared write-only sink for suppress_output; opened on first use and
+# intentionally never closed, so repeated suppressions don't churn file
+# descriptors.
+_devnull = None
+
 
 @contextmanager
 def suppress_output():
     """Context manager to suppress stdout and stderr temporarily."""
+    global _devnull
+    if _devnull is None:
+        _devnull = open(os.devnull, "w")
+
     # Save original stdout/stderr
     old_stdout = sys.stdout
     old_stderr = sys.stderr
 
     try:
         # Redirect to devnull
-        sys.stdout = open(os.devnull, "w")
-        sys.stderr = open(os.devnull, "w")
+        sys.stdout = _devnull
+        sys.stderr = _devnull
         yield
     finally:
         # Restore original stdout/stderr
-        sys.stdout.close()
-        sys.stderr.close()
         sys.stdout = old_stdout
         sys.stderr = old_stderr
 
 
+def _build_sync_wrapper(original_arun):
+    """Build a synchronous wrapper that runs `original_arun` on the shared loop."""
+
+    def sync_wrapper(*args, config=None, **kwargs):
+        """Synchronous wrapper for async tool - runs on the shared background loop."""
+        # Blocking on our own loop from within that loop would deadlock;
+        # callers already inside it must await the async interface instead
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is not None and running_loop is _bg_loop:
+            raise RuntimeError(
+                "Sync tool invocation from the MCP background loop would "
+                "deadlock; await the tool's async interface instead."
+            )
+
+        # Pass config as keyword-only argument if provided
+        if config is not None:
+            coro = original_arun(*args, config=config, **kwargs)
+        else:
+            coro = original_arun(*args, **kwargs)
+
+        # Submit to the persistent background loop to avoid event loop
+        # conflicts without paying thread + loop creation per call
+        future = asyncio.run_coroutine_threadsafe(coro, _get_bg_loop())
+        return future.result(timeout=120)  # 2 minute timeout
+
+    return sync_wrapper
+
+
+def _build_async_wrapper(original_arun):
+    """Build an async wrapper that preserves the original async behaviour."""
+
+    async def async_wrapper(*args, config=None, **kwargs):
+        """Async wrapper that calls original async function."""
+        # Pass config as keyword-only argument if provided
+        if config is not None:
+            return await original_arun(*args, config=config, **kwargs)
+        else:
+            return await original_arun(*args, **kwargs)
+
+    return async_wrapper
+
+
 def _make_tool_sync_compatible(tool):
     """
     Wrap an async-only MCP tool to support both sync and async invocation.
 
     LangChain's StructuredTool requires a _run method for sync calls,
     but MCP tools only have _arun (async). This wrapper adds sync support
-    by running the async function in a new thread with its own event loop.
+    by running the async function on a shared background event loop.
 
     This addresses the NotImplementedError('StructuredTool does not support sync invocation.')
     """
-    from langchain_core.tools import StructuredTool, Tool
-    import concurrent.futures
-    import inspect
+    from langchain_core.tools import StructuredTool
 
     # Check if it's a StructuredTool without sync support
     if isinstance(tool, StructuredTool):
-        # Store original async method and metadata
         original_arun = tool._arun
-        tool_name = tool.name
-        tool_description = tool.description
-        tool_args_schema = tool.args_schema
-
-        # Create a sync wrapper that runs the async function
-        def sync_wrapper(*args, config=None, **kwargs):
-            """Synchronous wrapper for async tool - runs in thread with new event loop."""
-
-            def run_async():
-                """Helper to run async function in new event loop."""
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    # Pass config as keyword-only argument if provided
-                    if config is not None:
-                        return new_loop.run_until_complete(
-                            original_arun(*args, config=config, **kwargs)
-                        )
-                    else:
-                        return new_loop.run_until_complete(
-                            original_arun(*args, **kwargs)
-                        )
-                finally:
-                    new_loop.close()
-
-            # Run in thread to avoid event loop conflicts
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_async)
-                return future.result(timeout=120)  # 2 minute timeout
-
-        # Create async wrapper to preserve async functionality
-        async def async_wrapper(*args, config=None, **kwargs):
-            """Async wrapper that calls original async function."""
-            # Pass config as keyword-only argument if provided
-            if config is not None:
-                return await original_arun(*args, config=config, **kwargs)
-            else:
-                return await original_arun(*args, **kwargs)
+        sync_wrapper = _build_sync_wrapper(original_arun)
+        async_wrapper = _build_async_wrapper(original_arun)
 
         # Method 1: Try to patch the existing tool
         try:
@@ -102,10 +191,14 @@ def _make_tool_sync_compatible(tool):
             if hasattr(tool, "coroutine"):
                 tool.coroutine = None
 
-            logger.debug(f"Patched tool '{tool_name}' with sync wrapper")
+            logger.debug(f"Patched tool '{tool.name}' with sync wrapper")
             return tool
 
         except Exception as e:
+            # Only the fallback paths need the tool metadata
+            tool_name = tool.name
+            tool_description = tool.description
+
             # Method 2: If patching fails, create a new StructuredTool
             logger.warning(
                 f"Failed to patch tool '{tool_name}': {e}. Creating new tool."
@@ -118,12 +211,14 @@ def _make_tool_sync_compatible(tool):
                     description=tool_description,
                     func=sync_wrapper,
                     coroutine=async_wrapper,
-                    args_schema=tool_args_schema,
+                    args_schema=tool.args_schema,
                 )
                 logger.debug(f"Created new sync-compatible tool '{tool_name}'")
                 return new_tool
             except Exception as e2:
                 # Method 3: Fallback to basic Tool class
+                from langchain_core.tools import Tool
+
                 logger.warning(
                     f"Failed to create StructuredTool for '{tool_name}': {e2}. Using basic Tool."
                 )
@@ -168,6 +263,9 @@ def get_mcp_tools(timeout: int = 30, silent: bool = False, include_memory: bool
     """
     Get MCP tools from the configured MCP client.
 
+    Results are cached process-wide for _TOOLS_TTL seconds; stale entries are
+    served immediately while a background refresh runs.
+
     Args:
         timeout: Timeout in seconds for loading MCP tools (default: 30)
         silent: If True, suppress all output (default: False)
@@ -176,30 +274,58 @@ def get_mcp_tools(timeout: int = 30, silent: bool = False, include_memory: bool
     Returns:
         List: A list of LangChain tools from the MCP client
     """
+    return _cached_tools(
+        ("all", include_memory),
+        lambda silent: _load_mcp_tools(timeout, silent, include_memory),
+        silent,
+    )
+
+
+def _safe_wrap(tool):
+    """Wrap a single tool for sync use, returning None on failure."""
+    try:
+        return _make_tool_sync_compatible(tool)
+    except Exception as e:
+        logger.error(
+            f"Failed to make tool '{getattr(tool, 'name', tool)}' sync-compatible: {e}"
+        )
+        # Skip this tool rather than failing completely
+        return None
+
+
+def _wrap_tools_sync_compatible(tools: List) -> List:
+    """Make all tools sync-compatible, wrapping them in parallel."""
+    if not tools:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(8, len(tools))
+    ) as executor:
+        wrapped = list(executor.map(_safe_wrap, tools))
+
+    return [tool for tool in wrapped if tool is not None]
+
+
+def _load_mcp_tools(timeout: int, silent: bool, include_memory: bool) -> List:
+    """Blocking load of MCP tools (uncached)."""
     try:
         if not silent:
             memory_note = " (with memory)" if include_memory else ""
             print(f"Loading MCP tools{memory_note} (timeout: {timeout}s)...")
-        tools = asyncio.run(_get_mcp_tools_with_timeout(timeout, include_memory=include_memory))
+        # Reuse the persistent background loop rather than paying
+        # asyncio.run's loop construction/teardown per invocation
+        future = asyncio.run_coroutine_threadsafe(
+            _get_mcp_tools_with_timeout(timeout, include_memory=include_memory),
+            _get_bg_loop(),
+        )
+        tools = future.result(timeout=timeout + 5)
 
         if not silent:
             print(f"[OK] Loaded {len(tools)} MCP tools, making them sync-compatible...")
 
-        # Make all tools sync-compatible
-        sync_tools = []
-        for i, tool in enumerate(tools):
-            try:
-                sync_tool = _make_tool_sync_compatible(tool)
-                sync_tools.append(sync_tool)
-                logger.debug(
-                    f"Tool {i+1}/{len(tools)}: '{sync_tool.name}' - sync-compatible"
-                )
-            except Exception as e:
-                logger.error(f"Failed to make tool {i+1} sync-compatible: {e}")
-                if not silent:
-                    print(f"[WARNING] Skipping tool {i+1} due to error: {e}")
-                # Skip this tool rather than failing completely
-                continue
+        # Make all tools sync-compatible (wrapping is independent per tool,
+        # so do it across a small thread pool)
+        sync_tools = _wrap_tools_sync_compatible(tools)
 
         logger.info(
             f"Successfully loaded {len(sync_tools)} MCP tools (sync-compatible)"
@@ -212,7 +338,7 @@ def get_mcp_tools(timeout: int = 30, silent: bool = False, include_memory: bool
                 )
 
         return sync_tools
-    except asyncio.TimeoutError:
+    except (asyncio.TimeoutError, concurrent.futures.TimeoutError):
         logger.warning(f"MCP tool loading timed out after {timeout}s")
         if not silent:
             print(
@@ -228,38 +354,13 @@ def get_mcp_tools(timeout: int = 30, silent: bool = False, include_memory: bool
         return []
 
 
-async def _get_mcp_tools_by_server_async(server_name: str) -> List:
-    """
-    Async helper to get MCP tools from a specific server.
-
-    Args:
-        server_name: Name of the MCP server
-
-    Returns:
-        List: A list of LangChain tools from the specified MCP server
-    """
-    mcp_client = get_mcp_client()
-    tools = await mcp_client.get_tools()
-
-    # Filter tools by server name if the tool has server metadata
-    server_tools = [
-        tool
-        for tool in tools
-        if hasattr(tool, "metadata") and tool.metadata.get("server") == server_name  # type: ignore
-    ]
-
-    if not server_tools:
-        # If no server metadata, return all tools (user can filter manually)
-        logger.warning(f"No server metadata found, returning all {len(tools)} tools")
-        return tools
-
-    return server_tools
-
-
 def get_mcp_tools_by_server(server_name: str, silent: bool = False) -> List:
     """
     Get MCP tools from a specific server.
 
+    Results are cached process-wide for _TOOLS_TTL seconds; stale entries are
+    served immediately while a background refresh runs.
+
     Args:
         server_name: Name of the MCP server (e.g., 'sequentialthinking', 'arxiv-latex-mcp')
         silent: If True, suppress all output (default: False)
@@ -267,40 +368,42 @@ def get_mcp_tools_by_server(server_name: str, silent: bool = False) -> List:
     Returns:
         List: A list of LangChain tools from the specified MCP server
     """
+    return _cached_tools(
+        ("server", server_name),
+        lambda silent: _load_mcp_tools_by_server(server_name, silent),
+        silent,
+    )
+
+
+def _load_mcp_tools_by_server(server_name: str, silent: bool) -> List:
+    """Filter the full (cached, already sync-compatible) tool list by server."""
     try:
         if not silent:
             print(f"Loading tools from MCP server '{server_name}'...")
 
-        server_tools = asyncio.run(_get_mcp_tools_by_server_async(server_name))
+        # Reuse the process-wide tool cache instead of constructing a second
+        # MultiServerMCPClient (and its stdio subprocesses) per server query
+        tools = get_mcp_tools(silent=True)
 
-        # Make all tools sync-compatible
-        sync_tools = []
-        for i, tool in enumerate(server_tools):
-            try:
-                sync_tool = _make_tool_sync_compatible(tool)
-                sync_tools.append(sync_tool)
-                logger.debug(
-                    f"Tool {i+1}/{len(server_tools)}: '{sync_tool.name}' - sync-compatible"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to make tool {i+1} from {server_name} sync-compatible: {e}"
-                )
-                if not silent:
-                    print(f"[WARNING] Skipping tool {i+1} due to error: {e}")
-                continue
+        # Filter tools by server name if the tool has server metadata
+        server_tools = [
+            tool
+            for tool in tools
+            if hasattr(tool, "metadata") and tool.metadata.get("server") == server_name  # type: ignore
+        ]
+
+        if not server_tools:
+            # If no server metadata, return all tools (user can filter manually)
+            logger.warning(f"No server metadata found, returning all {len(tools)} tools")
+            server_tools = tools
 
         logger.info(
-            f"Successfully loaded {len(sync_tools)} tools from {server_name} (sync-compatible)"
+            f"Successfully loaded {len(server_tools)} tools from {server_name} (sync-compatible)"
         )
         if not silent:
-            print(f"[OK] {len(sync_tools)} tools from '{server_name}' ready")
-            if len(sync_tools) < len(server_tools):
-                print(
-                    f"[WARNING] {len(server_tools) - len(sync_tools)} tools skipped due to errors"
-                )
+            print(f"[OK] {len(server_tools)} tools from '{server_name}' ready")
 
-        return sync_tools
+        return server_tools
     except Exception as e:
         logger.error(f"Failed to load MCP tools from {server_name}: {e}", exc_info=True)
         if not silent:
@@ -1,28 +1,45 @@
-"""
-Reusable prompt modules for the NAMI Multi-Agent Research System.
-
-This package contains modular prompt sections that can be composed
-together to build complete agent prompts without duplication.
-"""
-
-from src.prompts.modules.citations import CITATION_REQUIREMENTS
-from src.prompts.modules.output_formats import (
-    RESEARCH_OUTPUT_FORMAT,
-    ANALYSIS_OUTPUT_FORMAT,
-    SYNTHESIS_OUTPUT_FORMAT,
-)
-from src.prompts.modules.quality import (
-    QUALITY_STANDARDS,
-    QUALITY_CHECKLIST,
-    QUALITY_THRESHOLDS,
-)
-
-__all__ = [
-    "CITATION_REQUIREMENTS",
-    "RESEARCH_OUTPUT_FORMAT",
-    "ANALYSIS_OUTPUT_FORMAT",
-    "SYNTHESIS_OUTPUT_FORMAT",
-    "QUALITY_STANDARDS",
-    "QUALITY_CHECKLIST",
-    "QUALITY_THRESHOLDS",
-]
+"""
+Reusable prompt modules for the NAMI Multi-Agent Research System.
+
+This package contains modular prompt sections that can be composed
+together to build complete agent prompts without duplication.
+
+Submodules are imported lazily (PEP 562) so callers that need only one
+prompt family don't materialize the others' string constants.
+"""
+
+from importlib import import_module
+
+# Single source of truth for the public API: submodule -> exported names.
+# __all__ and the lazy loader are both derived from it.
+_EXPORTS = (
+    ("citations", ("CITATION_REQUIREMENTS",)),
+    (
+        "output_formats",
+        (
+            "RESEARCH_OUTPUT_FORMAT",
+            "ANALYSIS_OUTPUT_FORMAT",
+            "SYNTHESIS_OUTPUT_FORMAT",
+        ),
+    ),
+    (
+        "quality",
+        ("QUALITY_STANDARDS", "QUALITY_CHECKLIST", "QUALITY_THRESHOLDS"),
+    ),
+)
+
+__all__ = [name for _, names in _EXPORTS for name in names]
+
+_NAME_TO_SUBMODULE = {
+    name: submodule for submodule, names in _EXPORTS for name in names
+}
+
+
+def __getattr__(name):
+    submodule = _NAME_TO_SUBMODULE.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
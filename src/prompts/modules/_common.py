@@ -0,0 +1,27 @@
+"""
+Shared building blocks for the prompt modules.
+
+Keeps the banner formatting in one place so the submodules compose their
+section headers from a single rule string instead of repeating ~190 bytes
+of box-drawing characters per constant.
+"""
+
+import sys
+
+RULE = sys.intern("═" * 63)
+
+
+def banner(title: str) -> str:
+    """Return a banner-boxed section heading, e.g. for a prompt constant."""
+    return f"\n{RULE}\n{title}\n{RULE}\n"
+
+
+def compact(text: str) -> str:
+    """Strip insignificant whitespace from a prompt constant.
+
+    Drops the stray blank first line that triple-quoted literals pick up,
+    trailing whitespace on each line, and trailing blank lines. Runs once
+    at module import; the saved bytes are prompt tokens the LLM never
+    needed.
+    """
+    return "\n".join(line.rstrip() for line in text.strip("\n").splitlines()) + "\n"
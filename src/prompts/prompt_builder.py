@@ -1,342 +1,618 @@
-"""
-Prompt builder for composing agent prompts from modules.
-
-This module provides utilities to build prompts by combining
-reusable modules with role-specific content.
-"""
-
-from typing import List, Optional
-
-from src.prompts.modules.citations import (
-    CITATION_REQUIREMENTS,
-    CITATION_INLINE_FORMAT,
-    CITATION_BIBLIOGRAPHY_FORMAT,
-    CITATION_QUALITY_HIERARCHY,
-)
-from src.prompts.modules.output_formats import (
-    RESEARCH_OUTPUT_FORMAT,
-    ANALYSIS_OUTPUT_FORMAT,
-    SYNTHESIS_OUTPUT_FORMAT,
-    BRIEF_OUTPUT_FORMAT,
-    COMPARISON_OUTPUT_FORMAT,
-    CRITIQUE_OUTPUT_FORMAT,
-)
-from src.prompts.modules.quality import (
-    QUALITY_STANDARDS,
-    QUALITY_CHECKLIST,
-    QUALITY_THRESHOLDS,
-    ITERATION_LIMITS,
-    EVALUATION_DIMENSIONS,
-)
-
-
-class PromptBuilder:
-    """
-    Build agent prompts from reusable modules.
-
-    This class provides static methods to compose prompts by combining
-    modular sections with role-specific content, reducing duplication
-    and ensuring consistency across agents.
-
-    Usage:
-        # Build a custom researcher prompt
-        prompt = PromptBuilder.build_researcher(
-            name="Scout",
-            specialization="Focus on academic papers",
-            include_citation=True,
-            include_quality=True
-        )
-
-        # Build with custom sections
-        prompt = PromptBuilder.compose([
-            "You are a research assistant.",
-            CITATION_REQUIREMENTS,
-            QUALITY_STANDARDS,
-        ])
-    """
-
-    # ═══════════════════════════════════════════════════════════════
-    # CORE COMPOSITION METHODS
-    # ═══════════════════════════════════════════════════════════════
-
-    @staticmethod
-    def compose(sections: List[str], separator: str = "\n\n") -> str:
-        """
-        Compose a prompt from multiple sections.
-
-        Args:
-            sections: List of prompt sections to combine
-            separator: String to use between sections (default: double newline)
-
-        Returns:
-            Combined prompt string
-        """
-        # Filter out empty sections
-        non_empty = [s.strip() for s in sections if s and s.strip()]
-        return separator.join(non_empty)
-
-    @staticmethod
-    def with_header(content: str, header: str) -> str:
-        """
-        Add a header section to content.
-
-        Args:
-            content: The main content
-            header: Header text to prepend
-
-        Returns:
-            Content with header prepended
-        """
-        return f"{header}\n\n{content}"
-
-    @staticmethod
-    def with_footer(content: str, footer: str) -> str:
-        """
-        Add a footer section to content.
-
-        Args:
-            content: The main content
-            footer: Footer text to append
-
-        Returns:
-            Content with footer appended
-        """
-        return f"{content}\n\n{footer}"
-
-    # ═══════════════════════════════════════════════════════════════
-    # ROLE-SPECIFIC BUILDERS
-    # ═══════════════════════════════════════════════════════════════
-
-    @classmethod
-    def build_researcher(
-        cls,
-        name: str,
-        role_description: str = "a research specialist",
-        specialization: str = "",
-        include_citation: bool = True,
-        include_quality: bool = True,
-        include_output_format: bool = True,
-    ) -> str:
-        """
-        Build a researcher prompt with modular sections.
-
-        Args:
-            name: Name for the researcher
-            role_description: Brief role description
-            specialization: Additional focus/specialization instructions
-            include_citation: Whether to include citation requirements
-            include_quality: Whether to include quality standards
-            include_output_format: Whether to include output format
-
-        Returns:
-            Complete researcher prompt
-        """
-        sections = [
-            f"You are {name}, {role_description}.",
-        ]
-
-        if specialization:
-            sections.append(f"\n## Specialization\n{specialization}")
-
-        if include_citation:
-            sections.append(CITATION_REQUIREMENTS)
-
-        if include_quality:
-            sections.append(QUALITY_STANDARDS)
-
-        if include_output_format:
-            sections.append(RESEARCH_OUTPUT_FORMAT)
-
-        return cls.compose(sections)
-
-    @classmethod
-    def build_analyst(
-        cls,
-        name: str,
-        focus: str = "",
-        include_citation: bool = True,
-        include_output_format: bool = True,
-    ) -> str:
-        """
-        Build an analyst prompt with modular sections.
-
-        Args:
-            name: Name for the analyst
-            focus: Specific analysis focus
-            include_citation: Whether to include citation requirements
-            include_output_format: Whether to include output format
-
-        Returns:
-            Complete analyst prompt
-        """
-        sections = [
-            f"You are {name}, a pragmatic research analyst.",
-            "Short sentences. Actionable insights over exhaustive cataloging.",
-        ]
-
-        if focus:
-            sections.append(f"\n## Analysis Focus\n{focus}")
-
-        if include_citation:
-            sections.append(CITATION_INLINE_FORMAT)
-
-        if include_output_format:
-            sections.append(ANALYSIS_OUTPUT_FORMAT)
-
-        return cls.compose(sections)
-
-    @classmethod
-    def build_writer(
-        cls,
-        name: str,
-        style: str = "",
-        include_citation: bool = True,
-        include_output_format: bool = True,
-    ) -> str:
-        """
-        Build a writer prompt with modular sections.
-
-        Args:
-            name: Name for the writer
-            style: Writing style instructions
-            include_citation: Whether to include citation requirements
-            include_output_format: Whether to include output format
-
-        Returns:
-            Complete writer prompt
-        """
-        sections = [
-            f"You are {name}, a professional research writer.",
-            "Your role is to synthesize research findings into well-structured reports.",
-        ]
-
-        if style:
-            sections.append(f"\n## Writing Style\n{style}")
-
-        if include_citation:
-            sections.append(CITATION_BIBLIOGRAPHY_FORMAT)
-
-        if include_output_format:
-            sections.append(SYNTHESIS_OUTPUT_FORMAT)
-
-        return cls.compose(sections)
-
-    @classmethod
-    def build_critic(
-        cls,
-        name: str,
-        focus: str = "",
-        include_thresholds: bool = True,
-        include_output_format: bool = True,
-    ) -> str:
-        """
-        Build a critic prompt with modular sections.
-
-        Args:
-            name: Name for the critic
-            focus: Specific evaluation focus
-            include_thresholds: Whether to include quality thresholds
-            include_output_format: Whether to include output format
-
-        Returns:
-            Complete critic prompt
-        """
-        sections = [
-            f"You are {name}, a balanced critic and quality assurance specialist.",
-            "Provide constructive feedback with realistic expectations.",
-        ]
-
-        if focus:
-            sections.append(f"\n## Evaluation Focus\n{focus}")
-
-        if include_thresholds:
-            sections.append(QUALITY_THRESHOLDS)
-            sections.append(EVALUATION_DIMENSIONS)
-
-        if include_output_format:
-            sections.append(CRITIQUE_OUTPUT_FORMAT)
-
-        return cls.compose(sections)
-
-    @classmethod
-    def build_synthesizer(
-        cls,
-        name: str,
-        include_citation: bool = True,
-        include_quality: bool = True,
-    ) -> str:
-        """
-        Build a synthesizer prompt with modular sections.
-
-        Args:
-            name: Name for the synthesizer
-            include_citation: Whether to include citation requirements
-            include_quality: Whether to include quality checklist
-
-        Returns:
-            Complete synthesizer prompt
-        """
-        sections = [
-            f"You are {name}, a master synthesizer and knowledge integrator.",
-            "Integrate findings from multiple research agents into coherent reports.",
-        ]
-
-        if include_citation:
-            sections.append(CITATION_BIBLIOGRAPHY_FORMAT)
-
-        sections.append(SYNTHESIS_OUTPUT_FORMAT)
-
-        if include_quality:
-            sections.append(QUALITY_CHECKLIST)
-
-        return cls.compose(sections)
-
-    # ═══════════════════════════════════════════════════════════════
-    # MODULE ACCESSORS
-    # ═══════════════════════════════════════════════════════════════
-
-    @staticmethod
-    def get_citation_module() -> str:
-        """Get the full citation requirements module."""
-        return CITATION_REQUIREMENTS
-
-    @staticmethod
-    def get_quality_module() -> str:
-        """Get the full quality standards module."""
-        return QUALITY_STANDARDS
-
-    @staticmethod
-    def get_iteration_limits() -> str:
-        """Get the iteration limits module."""
-        return ITERATION_LIMITS
-
-    @staticmethod
-    def get_output_format(format_type: str) -> str:
-        """
-        Get an output format module by type.
-
-        Args:
-            format_type: One of 'research', 'analysis', 'synthesis', 'brief', 'comparison', 'critique'
-
-        Returns:
-            The output format template
-
-        Raises:
-            ValueError: If format_type is not recognized
-        """
-        formats = {
-            "research": RESEARCH_OUTPUT_FORMAT,
-            "analysis": ANALYSIS_OUTPUT_FORMAT,
-            "synthesis": SYNTHESIS_OUTPUT_FORMAT,
-            "brief": BRIEF_OUTPUT_FORMAT,
-            "comparison": COMPARISON_OUTPUT_FORMAT,
-            "critique": CRITIQUE_OUTPUT_FORMAT,
-        }
-
-        if format_type.lower() not in formats:
-            raise ValueError(
-                f"Unknown format type: {format_type}. "
-                f"Valid types: {', '.join(formats.keys())}"
-            )
-
-        return formats[format_type.lower()]
+"""
+Prompt builder for composing agent prompts from modules.
+
+This module provides utilities to build prompts by combining
+reusable modules with role-specific content.
+"""
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Any, List, Optional, Tuple
+
+from src.prompts.modules.citations import (
+    CITATION_REQUIREMENTS,
+    CITATION_INLINE_FORMAT,
+    CITATION_BIBLIOGRAPHY_FORMAT,
+    CITATION_QUALITY_HIERARCHY,
+)
+from src.prompts.modules.output_formats import (
+    RESEARCH_OUTPUT_FORMAT,
+    ANALYSIS_OUTPUT_FORMAT,
+    SYNTHESIS_OUTPUT_FORMAT,
+    BRIEF_OUTPUT_FORMAT,
+    COMPARISON_OUTPUT_FORMAT,
+    CRITIQUE_OUTPUT_FORMAT,
+)
+from src.prompts.modules.quality import (
+    QUALITY_STANDARDS,
+    QUALITY_CHECKLIST,
+    QUALITY_THRESHOLDS,
+    ITERATION_LIMITS,
+    EVALUATION_DIMENSIONS,
+)
+
+
+# ═══════════════════════════════════════════════════════════════
+# PRE-STRIPPED MODULE CONSTANTS
+# ═══════════════════════════════════════════════════════════════
+# compose() strips every section it joins. The module constants never
+# change, so they are stripped exactly once here instead of rescanning
+# kilobytes of static text on every build; only the small dynamic
+# pieces still pay a per-call strip.
+
+_CITATION_REQUIREMENTS = CITATION_REQUIREMENTS.strip()
+_CITATION_INLINE_FORMAT = CITATION_INLINE_FORMAT.strip()
+_CITATION_BIBLIOGRAPHY_FORMAT = CITATION_BIBLIOGRAPHY_FORMAT.strip()
+_RESEARCH_OUTPUT_FORMAT = RESEARCH_OUTPUT_FORMAT.strip()
+_ANALYSIS_OUTPUT_FORMAT = ANALYSIS_OUTPUT_FORMAT.strip()
+_SYNTHESIS_OUTPUT_FORMAT = SYNTHESIS_OUTPUT_FORMAT.strip()
+_CRITIQUE_OUTPUT_FORMAT = CRITIQUE_OUTPUT_FORMAT.strip()
+_QUALITY_STANDARDS = QUALITY_STANDARDS.strip()
+_QUALITY_CHECKLIST = QUALITY_CHECKLIST.strip()
+_QUALITY_THRESHOLDS = QUALITY_THRESHOLDS.strip()
+_EVALUATION_DIMENSIONS = EVALUATION_DIMENSIONS.strip()
+
+
+# ═══════════════════════════════════════════════════════════════
+# PRECOMPOSED STATIC TAILS
+# ═══════════════════════════════════════════════════════════════
+# Everything after a role's dynamic header is a fixed selection of
+# module constants, so the joined tail for every flag combination is
+# materialized once at import (2-3 flags per role, so at most eight
+# variants). A build then joins the header pieces with one precomposed
+# string instead of re-joining the multi-KB constants per cache miss.
+# Tails are interned so an identical module combination shared by two
+# roles (e.g. writer's and synthesizer's bibliography+synthesis tail)
+# is stored once instead of per-role.
+
+_RESEARCHER_TAILS = {
+    (c, q, o): sys.intern(
+        "\n\n".join(
+            s
+            for s, keep in (
+                (_CITATION_REQUIREMENTS, c),
+                (_QUALITY_STANDARDS, q),
+                (_RESEARCH_OUTPUT_FORMAT, o),
+            )
+            if keep
+        )
+    )
+    for c, q, o in product((False, True), repeat=3)
+}
+
+_ANALYST_TAILS = {
+    (c, o): sys.intern(
+        "\n\n".join(
+            s
+            for s, keep in (
+                (_CITATION_INLINE_FORMAT, c),
+                (_ANALYSIS_OUTPUT_FORMAT, o),
+            )
+            if keep
+        )
+    )
+    for c, o in product((False, True), repeat=2)
+}
+
+_WRITER_TAILS = {
+    (c, o): sys.intern(
+        "\n\n".join(
+            s
+            for s, keep in (
+                (_CITATION_BIBLIOGRAPHY_FORMAT, c),
+                (_SYNTHESIS_OUTPUT_FORMAT, o),
+            )
+            if keep
+        )
+    )
+    for c, o in product((False, True), repeat=2)
+}
+
+_CRITIC_TAILS = {
+    (t, o): sys.intern(
+        "\n\n".join(
+            s
+            for s, keep in (
+                (_QUALITY_THRESHOLDS, t),
+                (_EVALUATION_DIMENSIONS, t),
+                (_CRITIQUE_OUTPUT_FORMAT, o),
+            )
+            if keep
+        )
+    )
+    for t, o in product((False, True), repeat=2)
+}
+
+_SYNTHESIZER_TAILS = {
+    (c, q): sys.intern(
+        "\n\n".join(
+            s
+            for s, keep in (
+                (_CITATION_BIBLIOGRAPHY_FORMAT, c),
+                (_SYNTHESIS_OUTPUT_FORMAT, True),
+                (_QUALITY_CHECKLIST, q),
+            )
+            if keep
+        )
+    )
+    for c, q in product((False, True), repeat=2)
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# CACHED BUILDER CORES
+# ═══════════════════════════════════════════════════════════════
+# The build_* classmethods are pure functions of their (hashable)
+# arguments, so the actual composition lives in these module-level
+# functions where lru_cache can memoize the finished string. Repeat
+# builds of the same role prompt become a dict hit instead of
+# re-stripping and re-joining kilobytes of module text. Each core
+# assembles a fixed-arity tuple of conditional parts and joins the
+# truthy ones, skipping list growth and the compose() call entirely.
+# Results are interned: spawning many identically configured agents
+# then shares one prompt object, and downstream equality checks on the
+# prompt degrade to pointer compares.
+
+
+@lru_cache(maxsize=256)
+def _build_researcher(
+    name: str,
+    role_description: str,
+    specialization: str,
+    include_citation: bool,
+    include_quality: bool,
+    include_output_format: bool,
+) -> str:
+    parts = (
+        f"You are {name}, {role_description}.".strip(),
+        f"## Specialization\n{specialization}".strip() if specialization else "",
+        _RESEARCHER_TAILS[include_citation, include_quality, include_output_format],
+    )
+    return sys.intern("\n\n".join(p for p in parts if p))
+
+
+@lru_cache(maxsize=256)
+def _build_analyst(
+    name: str,
+    focus: str,
+    include_citation: bool,
+    include_output_format: bool,
+) -> str:
+    parts = (
+        f"You are {name}, a pragmatic research analyst.".strip(),
+        "Short sentences. Actionable insights over exhaustive cataloging.",
+        f"## Analysis Focus\n{focus}".strip() if focus else "",
+        _ANALYST_TAILS[include_citation, include_output_format],
+    )
+    return sys.intern("\n\n".join(p for p in parts if p))
+
+
+@lru_cache(maxsize=256)
+def _build_writer(
+    name: str,
+    style: str,
+    include_citation: bool,
+    include_output_format: bool,
+) -> str:
+    parts = (
+        f"You are {name}, a professional research writer.".strip(),
+        "Your role is to synthesize research findings into well-structured reports.",
+        f"## Writing Style\n{style}".strip() if style else "",
+        _WRITER_TAILS[include_citation, include_output_format],
+    )
+    return sys.intern("\n\n".join(p for p in parts if p))
+
+
+@lru_cache(maxsize=256)
+def _build_critic(
+    name: str,
+    focus: str,
+    include_thresholds: bool,
+    include_output_format: bool,
+) -> str:
+    parts = (
+        f"You are {name}, a balanced critic and quality assurance specialist.".strip(),
+        "Provide constructive feedback with realistic expectations.",
+        f"## Evaluation Focus\n{focus}".strip() if focus else "",
+        _CRITIC_TAILS[include_thresholds, include_output_format],
+    )
+    return sys.intern("\n\n".join(p for p in parts if p))
+
+
+@lru_cache(maxsize=256)
+def _build_synthesizer(
+    name: str,
+    include_citation: bool,
+    include_quality: bool,
+) -> str:
+    parts = (
+        f"You are {name}, a master synthesizer and knowledge integrator.".strip(),
+        "Integrate findings from multiple research agents into coherent reports.",
+        _SYNTHESIZER_TAILS[include_citation, include_quality],
+    )
+    return sys.intern("\n\n".join(p for p in parts if p))
+
+
+# Hoisted out of get_output_format() so the dispatch table is built
+# once, not reconstructed (six hash inserts) per lookup.
+_FORMATS = {
+    "research": RESEARCH_OUTPUT_FORMAT,
+    "analysis": ANALYSIS_OUTPUT_FORMAT,
+    "synthesis": SYNTHESIS_OUTPUT_FORMAT,
+    "brief": BRIEF_OUTPUT_FORMAT,
+    "comparison": COMPARISON_OUTPUT_FORMAT,
+    "critique": CRITIQUE_OUTPUT_FORMAT,
+}
+_FORMAT_KEYS = ", ".join(_FORMATS)
+
+
+_CACHED_BUILDERS = (
+    _build_researcher,
+    _build_analyst,
+    _build_writer,
+    _build_critic,
+    _build_synthesizer,
+)
+
+
+class PromptBuilder:
+    """
+    Build agent prompts from reusable modules.
+
+    This class provides static methods to compose prompts by combining
+    modular sections with role-specific content, reducing duplication
+    and ensuring consistency across agents.
+
+    Usage:
+        # Build a custom researcher prompt
+        prompt = PromptBuilder.build_researcher(
+            name="Scout",
+            specialization="Focus on academic papers",
+            include_citation=True,
+            include_quality=True
+        )
+
+        # Build with custom sections
+        prompt = PromptBuilder.compose([
+            "You are a research assistant.",
+            CITATION_REQUIREMENTS,
+            QUALITY_STANDARDS,
+        ])
+    """
+
+    # ═══════════════════════════════════════════════════════════════
+    # CORE COMPOSITION METHODS
+    # ═══════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def compose(
+        sections: List[str],
+        separator: str = "\n\n",
+        prestripped: bool = False,
+    ) -> str:
+        """
+        Compose a prompt from multiple sections.
+
+        Args:
+            sections: List of prompt sections to combine
+            separator: String to use between sections (default: double newline)
+            prestripped: Set when every section is already stripped, as
+                with the module-level _* constants; skips the per-section
+                strip and only filters out empty entries
+
+        Returns:
+            Combined prompt string
+        """
+        if prestripped:
+            return separator.join([s for s in sections if s])
+        # Filter out empty sections. Checking the boundary characters
+        # first skips the full strip() scan for already-clean sections,
+        # which is the common case for the module constants.
+        non_empty = []
+        for s in sections:
+            if not s:
+                continue
+            if s[0].isspace() or s[-1].isspace():
+                s = s.strip()
+                if not s:
+                    continue
+            non_empty.append(s)
+        return separator.join(non_empty)
+
+    @staticmethod
+    def compose_with_header_footer(
+        sections: List[str],
+        header: str = "",
+        footer: str = "",
+        separator: str = "\n\n",
+        prestripped: bool = False,
+    ) -> str:
+        """
+        Compose sections with an optional header and footer in one join.
+
+        Equivalent to with_header(compose(sections), header) etc., but
+        everything goes through a single join so the output buffer is
+        allocated once instead of copying the composed body again for
+        each wrapping step.
+
+        Args:
+            sections: List of prompt sections to combine
+            header: Optional header text to prepend
+            footer: Optional footer text to append
+            separator: String to use between sections (default: double newline)
+            prestripped: Passed through to compose(); see there
+
+        Returns:
+            Combined prompt string
+        """
+        parts = []
+        if header:
+            parts.append(header)
+        parts.extend(sections)
+        if footer:
+            parts.append(footer)
+        return PromptBuilder.compose(parts, separator, prestripped)
+
+    @staticmethod
+    def wrap(content: str, header: str = "", footer: str = "") -> str:
+        """
+        Surround content with an optional header and footer in one pass.
+
+        Preferred over chaining with_header()/with_footer(): the single
+        join pre-allocates the final buffer instead of building an
+        intermediate header+content string first.
+
+        Args:
+            content: The main content
+            header: Optional header text to prepend
+            footer: Optional footer text to append
+
+        Returns:
+            Content with header/footer attached
+        """
+        parts = [p for p in (header, content, footer) if p]
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def with_header(content: str, header: str) -> str:
+        """
+        Add a header section to content.
+
+        Args:
+            content: The main content
+            header: Header text to prepend
+
+        Returns:
+            Content with header prepended
+        """
+        return PromptBuilder.wrap(content, header=header)
+
+    @staticmethod
+    def with_footer(content: str, footer: str) -> str:
+        """
+        Add a footer section to content.
+
+        Args:
+            content: The main content
+            footer: Footer text to append
+
+        Returns:
+            Content with footer appended
+        """
+        return PromptBuilder.wrap(content, footer=footer)
+
+    # ═══════════════════════════════════════════════════════════════
+    # ROLE-SPECIFIC BUILDERS
+    # ═══════════════════════════════════════════════════════════════
+
+    @classmethod
+    def build_researcher(
+        cls,
+        name: str,
+        role_description: str = "a research specialist",
+        specialization: str = "",
+        include_citation: bool = True,
+        include_quality: bool = True,
+        include_output_format: bool = True,
+    ) -> str:
+        """
+        Build a researcher prompt with modular sections.
+
+        Args:
+            name: Name for the researcher
+            role_description: Brief role description
+            specialization: Additional focus/specialization instructions
+            include_citation: Whether to include citation requirements
+            include_quality: Whether to include quality standards
+            include_output_format: Whether to include output format
+
+        Returns:
+            Complete researcher prompt
+        """
+        return _build_researcher(
+            name,
+            role_description,
+            specialization,
+            include_citation,
+            include_quality,
+            include_output_format,
+        )
+
+    @classmethod
+    def build_analyst(
+        cls,
+        name: str,
+        focus: str = "",
+        include_citation: bool = True,
+        include_output_format: bool = True,
+    ) -> str:
+        """
+        Build an analyst prompt with modular sections.
+
+        Args:
+            name: Name for the analyst
+            focus: Specific analysis focus
+            include_citation: Whether to include citation requirements
+            include_output_format: Whether to include output format
+
+        Returns:
+            Complete analyst prompt
+        """
+        return _build_analyst(name, focus, include_citation, include_output_format)
+
+    @classmethod
+    def build_writer(
+        cls,
+        name: str,
+        style: str = "",
+        include_citation: bool = True,
+        include_output_format: bool = True,
+    ) -> str:
+        """
+        Build a writer prompt with modular sections.
+
+        Args:
+            name: Name for the writer
+            style: Writing style instructions
+            include_citation: Whether to include citation requirements
+            include_output_format: Whether to include output format
+
+        Returns:
+            Complete writer prompt
+        """
+        return _build_writer(name, style, include_citation, include_output_format)
+
+    @classmethod
+    def build_critic(
+        cls,
+        name: str,
+        focus: str = "",
+        include_thresholds: bool = True,
+        include_output_format: bool = True,
+    ) -> str:
+        """
+        Build a critic prompt with modular sections.
+
+        Args:
+            name: Name for the critic
+            focus: Specific evaluation focus
+            include_thresholds: Whether to include quality thresholds
+            include_output_format: Whether to include output format
+
+        Returns:
+            Complete critic prompt
+        """
+        return _build_critic(name, focus, include_thresholds, include_output_format)
+
+    @classmethod
+    def build_synthesizer(
+        cls,
+        name: str,
+        include_citation: bool = True,
+        include_quality: bool = True,
+    ) -> str:
+        """
+        Build a synthesizer prompt with modular sections.
+
+        Args:
+            name: Name for the synthesizer
+            include_citation: Whether to include citation requirements
+            include_quality: Whether to include quality checklist
+
+        Returns:
+            Complete synthesizer prompt
+        """
+        return _build_synthesizer(name, include_citation, include_quality)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the memoized role-prompt caches (mainly for tests)."""
+        for builder in _CACHED_BUILDERS:
+            builder.cache_clear()
+
+    # ═══════════════════════════════════════════════════════════════
+    # MODULE ACCESSORS
+    # ═══════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def get_citation_module() -> str:
+        """Get the full citation requirements module."""
+        return CITATION_REQUIREMENTS
+
+    @staticmethod
+    def get_quality_module() -> str:
+        """Get the full quality standards module."""
+        return QUALITY_STANDARDS
+
+    @staticmethod
+    def get_iteration_limits() -> str:
+        """Get the iteration limits module."""
+        return ITERATION_LIMITS
+
+    @staticmethod
+    def get_output_format(format_type: str) -> str:
+        """
+        Get an output format module by type.
+
+        Args:
+            format_type: One of 'research', 'analysis', 'synthesis', 'brief', 'comparison', 'critique'
+
+        Returns:
+            The output format template
+
+        Raises:
+            ValueError: If format_type is not recognized
+        """
+        fmt = _FORMATS.get(format_type.lower())
+        if fmt is None:
+            raise ValueError(
+                f"Unknown format type: {format_type}. "
+                f"Valid types: {_FORMAT_KEYS}"
+            )
+        return fmt
+
+
+# ═══════════════════════════════════════════════════════════════
+# DEFERRED PROMPT SPECS
+# ═══════════════════════════════════════════════════════════════
+
+_SPEC_KINDS = frozenset(
+    {"researcher", "analyst", "writer", "critic", "synthesizer"}
+)
+
+
+@dataclass(frozen=True)
+class PromptSpec:
+    """A role-prompt configuration that composes its text on demand.
+
+    Registries holding many agent configurations can store the ~100-byte
+    spec instead of the multi-KB composed prompt; .text builds the
+    string only when the prompt is actually sent. Composition goes
+    through the memoized builder cores, so repeated materialization of
+    the same spec (or of equal specs) returns the one interned string —
+    a per-instance cache would be redundant.
+
+    Usage:
+        spec = PromptSpec.create("researcher", "Scout", specialization="...")
+        agent = SubagentConfig(..., system_prompt=spec.text)
+    """
+
+    kind: str
+    name: str
+    options: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def create(cls, kind: str, name: str, **options) -> "PromptSpec":
+        """Build a spec, validating the role kind up front."""
+        if kind not in _SPEC_KINDS:
+            valid = ", ".join(sorted(_SPEC_KINDS))
+            raise ValueError(f"Unknown prompt kind: {kind}. Valid kinds: {valid}")
+        return cls(kind=kind, name=name, options=tuple(sorted(options.items())))
+
+    @property
+    def text(self) -> str:
+        """The composed prompt for this configuration."""
+        builder = getattr(PromptBuilder, f"build_{self.kind}")
+        return builder(name=self.name, **dict(self.options))